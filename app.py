@@ -1,10 +1,217 @@
 """Lucidia Core API - AI reasoning engines."""
 
+import importlib
+import math
 import os
-import sympy as sp
+import threading
+from collections import OrderedDict, namedtuple
+from functools import cache, lru_cache, wraps
+
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
+
+try:  # Optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to Flask's stdlib provider
+    orjson = None
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by ``orjson``."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+
+@cache
+def _sp():
+    """Import SymPy on first use so the app starts without paying for it."""
+    return importlib.import_module("sympy")
+
+
+@cache
+def _np():
+    """Import NumPy on first use; only ``/math/eval_batch`` needs it."""
+    return importlib.import_module("numpy")
+
+
+# Upper bound on distinct expressions memoized by each helper below.
+_CACHE_SIZE = 4096
+# Results longer than this many characters are returned but never cached, so
+# a handful of short requests cannot pin huge strings in memory.
+_MAX_CACHED_RESULT_CHARS = 16_384
+# Polynomials whose expansion could exceed this many terms are left as-is.
+_MAX_EXPAND_TERMS = 256
+
+
+_CacheInfo = namedtuple("_CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _result_cache(fn):
+    """Memoize ``fn`` like ``lru_cache(_CACHE_SIZE)``, skipping oversized results.
+
+    ``fn`` must return a string or a tuple of strings; results longer than
+    ``_MAX_CACHED_RESULT_CHARS`` in total are recomputed on every call.
+    """
+    entries = OrderedDict()
+    lock = threading.Lock()
+    stats = {"hits": 0, "misses": 0}
+
+    @wraps(fn)
+    def wrapper(*args):
+        with lock:
+            if args in entries:
+                entries.move_to_end(args)
+                stats["hits"] += 1
+                return entries[args]
+            stats["misses"] += 1
+        result = fn(*args)
+        size = sum(map(len, result)) if isinstance(result, tuple) else len(result)
+        if size <= _MAX_CACHED_RESULT_CHARS:
+            with lock:
+                entries[args] = result
+                if len(entries) > _CACHE_SIZE:
+                    entries.popitem(last=False)
+        return result
+
+    def cache_info():
+        with lock:
+            return _CacheInfo(stats["hits"], stats["misses"], _CACHE_SIZE, len(entries))
+
+    def cache_clear():
+        with lock:
+            entries.clear()
+            stats.update(hits=0, misses=0)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+@lru_cache(maxsize=8192)
+def _parse(expr_str):
+    """Parse ``expr_str`` into a SymPy expression, once per distinct string.
+
+    SymPy expressions are immutable, so the cached object is shared by every
+    request and handed straight to ``diff``/``simplify``/``evalf``.
+    """
+    return _sp().sympify(expr_str)
+
+
+_SYMBOL_CACHE = {}
+
+
+def _sym(name):
+    """Return an interned :class:`sympy.Symbol` for ``name``."""
+    symbol = _SYMBOL_CACHE.get(name)
+    if symbol is None:
+        symbol = _sp().Symbol(name)
+        # Variable names come from clients, so stop interning once full.
+        if len(_SYMBOL_CACHE) < _CACHE_SIZE:
+            symbol = _SYMBOL_CACHE.setdefault(name, symbol)
+    return symbol
+
+
+def _expression_key(expr):
+    """Return the cache key for a raw ``expression`` request field."""
+    return expr.strip() if isinstance(expr, str) else expr
+
+
+def _expanded_terms(expr, limit):
+    """Upper bound on the terms ``sp.expand(expr)`` yields, capped at ``limit + 1``.
+
+    Computed from the expression tree without expanding anything.
+    """
+    if expr.is_Add:
+        total = 0
+        for arg in expr.args:
+            total += _expanded_terms(arg, limit)
+            if total > limit:
+                return limit + 1
+        return total
+    if expr.is_Mul:
+        total = 1
+        for arg in expr.args:
+            total *= _expanded_terms(arg, limit)
+            if total > limit:
+                return limit + 1
+        return total
+    if expr.is_Pow and expr.exp.is_Integer and expr.exp > 1:
+        base = _expanded_terms(expr.base, limit)
+        if base == 1:
+            return 1
+        power = int(expr.exp)
+        if power > limit:
+            return limit + 1
+        # Monomials of degree ``power`` in ``base`` terms.
+        return min(math.comb(base + power - 1, power), limit + 1)
+    return 1
+
+
+def _cheap_canonical(expr, full=False):
+    """Return a canonical form of ``expr`` without paying for ``sp.simplify``.
+
+    Numbers are returned as-is and polynomials are expanded, unless the
+    expansion could exceed ``_MAX_EXPAND_TERMS`` terms, in which case they are
+    returned unchanged; anything else is only combined over a common
+    denominator. ``sp.simplify`` is reserved for callers that explicitly ask
+    for it with ``full``.
+    """
+    sp = _sp()
+    if full:
+        return sp.simplify(expr)
+    if not isinstance(expr, sp.Expr) or expr.is_Number:
+        return expr
+    if expr.is_polynomial():
+        if _expanded_terms(expr, _MAX_EXPAND_TERMS) > _MAX_EXPAND_TERMS:
+            return expr
+        return sp.expand(expr)
+    return sp.together(expr)
+
+
+def _wants_full(data):
+    """Return whether the request opted into full ``sp.simplify``."""
+    return request.args.get("full") in ("1", "true") or data.get("full") is True
+
+
+@_result_cache
+def _cached_math(expr_str, full=False):
+    """Return ``(result, simplified)`` strings for the ``/math`` route."""
+    sym_expr = _parse(expr_str)
+    result = sym_expr.evalf() if sym_expr.is_number else sym_expr
+    return str(result), str(_cheap_canonical(sym_expr, full))
+
+
+@_result_cache
+def _cached_simplify(expr_str, full=False):
+    """Return the canonical form of ``expr_str`` as a string."""
+    return str(_cheap_canonical(_parse(expr_str), full))
+
+
+@_result_cache
+def _cached_diff(expr_str, var):
+    """Return the derivative of ``expr_str`` with respect to ``var`` as a string."""
+    return str(_sp().diff(_parse(expr_str), _sym(var)))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _lambdify_cached(expr_str, var):
+    """Compile ``expr_str`` into a vectorised NumPy function of ``var``."""
+    symbol = _sym(var)
+    expr = _parse(expr_str)
+    extra = expr.free_symbols - {symbol}
+    if extra:
+        names = ", ".join(sorted(str(s) for s in extra))
+        raise ValueError(f"expression depends on variables other than {var}: {names}")
+    return _sp().lambdify(symbol, expr, modules="numpy")
 
 
 @app.route("/")
@@ -24,6 +231,7 @@ def index():
         "endpoints": {
             "/health": "Health check",
             "/math": "Evaluate mathematical expressions",
+            "/math/eval_batch": "Evaluate an expression at many points",
             "/derivative": "Compute derivatives",
             "/simplify": "Simplify expressions"
         }
@@ -44,12 +252,39 @@ def evaluate_math():
     if not expr:
         return jsonify({"error": "missing expression"}), 400
     try:
-        sym_expr = sp.sympify(expr)
-        result = sym_expr.evalf() if sym_expr.is_number else sym_expr
+        result, simplified = _cached_math(_expression_key(expr), _wants_full(data))
         return jsonify({
             "expression": expr,
-            "result": str(result),
-            "simplified": str(sp.simplify(sym_expr))
+            "result": result,
+            "simplified": simplified
+        })
+    except Exception as exc:
+        return jsonify({"error": str(exc)}), 400
+
+
+@app.post("/math/eval_batch")
+def evaluate_batch():
+    """Evaluate an expression numerically at many points of one variable."""
+    data = request.get_json(silent=True) or {}
+    expr = data.get("expression")
+    var = data.get("variable", "x")
+    points = data.get("points")
+    if not expr:
+        return jsonify({"error": "missing expression"}), 400
+    if points is None:
+        return jsonify({"error": "missing points"}), 400
+    try:
+        np = _np()
+        xs = np.asarray(points, dtype=np.float64)
+        if xs.ndim != 1:
+            return jsonify({"error": "points must be a flat list of numbers"}), 400
+        fn = _lambdify_cached(_expression_key(expr), var)
+        # Constant expressions return a scalar; broadcast it as floats.
+        values = np.broadcast_to(np.asarray(fn(xs), dtype=float), xs.shape)
+        return jsonify({
+            "expression": expr,
+            "variable": var,
+            "values": values.tolist()
         })
     except Exception as exc:
         return jsonify({"error": str(exc)}), 400
@@ -64,13 +299,10 @@ def derivative():
     if not expr:
         return jsonify({"error": "missing expression"}), 400
     try:
-        sym_expr = sp.sympify(expr)
-        x = sp.Symbol(var)
-        deriv = sp.diff(sym_expr, x)
         return jsonify({
             "expression": expr,
             "variable": var,
-            "derivative": str(deriv)
+            "derivative": _cached_diff(_expression_key(expr), var)
         })
     except Exception as exc:
         return jsonify({"error": str(exc)}), 400
@@ -84,11 +316,9 @@ def simplify():
     if not expr:
         return jsonify({"error": "missing expression"}), 400
     try:
-        sym_expr = sp.sympify(expr)
-        simplified = sp.simplify(sym_expr)
         return jsonify({
             "expression": expr,
-            "simplified": str(simplified)
+            "simplified": _cached_simplify(_expression_key(expr), _wants_full(data))
         })
     except Exception as exc:
         return jsonify({"error": str(exc)}), 400
@@ -1,10 +1,17 @@
 """Engine wrappers for Lucidia."""
 
-from .condor_engine import load_model_from_source, optimize, simulate_ode, solve_algebraic
+from .condor_engine import (
+    load_model_from_source,
+    optimize,
+    simulate_ode,
+    solve_algebraic,
+    to_json_bytes,
+)
 
 __all__ = [
     "load_model_from_source",
     "optimize",
     "simulate_ode",
     "solve_algebraic",
+    "to_json_bytes",
 ]
@@ -1,160 +1,309 @@
-"""Utilities for working with NASA Condor models.
-
-This module provides lightweight helpers that wrap the Condor modelling
-interfaces.  The helpers are intentionally small so that unit tests can run
-without requiring the real Condor dependency.  The goal is to expose a stable
-Python API that can be imported by agents or HTTP routes in constrained
-environments.
-"""Utilities for working with Condor models.
-
-Wrappers for running NASA Condor models locally. The helpers implement a
-small subset of the full Condor API suitable for local experimentation
-and unit tests.
-This module intentionally implements only a very small subset of the full
-design proposed in the specification. The helpers defined here are sufficient
-for local experimentation and unit testing. Advanced sandboxing, provenance
-and solver features should be implemented in the future.
-"""Utilities for running NASA Condor models locally.
+"""Wrappers for running NASA Condor models locally.
 
 This module intentionally implements only a very small subset of the full
 Condor feature set. The helpers defined here are sufficient for local
 experimentation and unit testing. Advanced sandboxing, provenance, and solver
 features should be implemented in the future.
 
-The helpers in this file provide lightweight wrappers around Condor's modelling
-interfaces. The functions are intentionally small so the heavy lifting remains
-within the Condor library itself. The goal is to expose a stable Python API
-that can be called from agents or HTTP routes without pulling in any remote
-resources.
-
 The actual Condor package is optional at import time so the repository can be
 used in environments where the dependency is not yet installed. Runtime errors
 are only raised if helpers that require Condor are invoked when it is missing.
-# ruff: noqa
-
-"""Wrappers for running NASA Condor models locally.
-
-The helpers here expose a minimal, import-safe subset of Condor's
-functionality so tests can exercise code paths without requiring the full
-dependency. The real Condor package is optional at import time; calling
-these helpers will raise ``RuntimeError`` if Condor is not installed.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
-from pathlib import Path
-"""Lightweight helpers for Condor model execution used in tests."""
-
-from __future__ import annotations
-
 import ast
-import importlib.util
+import hashlib
+import json
+import re
 import sys
-import tempfile
-from dataclasses import asdict, is_dataclass
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
 from types import ModuleType
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Final, FrozenSet, Optional, Type
 
-try:  # Optional dependency used only at runtime
 try:  # pragma: no cover - optional dependency
-try:  # Optional dependency
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover - numpy may be absent
     np = None  # type: ignore
 
-try:  # Condor itself may not be installed in all environments
-    import condor  # type: ignore  # noqa: F401
-except Exception:  # pragma: no cover - Condor may be absent
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - stdlib json is used instead
+    orjson = None  # type: ignore
+
 try:  # pragma: no cover - optional dependency
     import condor  # type: ignore
 except Exception:  # pragma: no cover - condor may be absent in CI
     condor = None  # type: ignore
-try:  # pragma: no cover - optional dependency in CI
-    import numpy as np  # type: ignore
-except Exception:  # pragma: no cover
-    np = None  # type: ignore
 
-condor = None  # placeholder for the real library at runtime
+CONDOR_PACKAGE_PREFIX: Final = "condor"
+
+ALLOWED_IMPORTS: Final[frozenset[str]] = frozenset({"condor", "math", "numpy", "dataclasses"})
+FORBIDDEN_NAMES: Final[frozenset[str]] = frozenset(
+    {
+        "open",
+        "os",
+        "sys",
+        "subprocess",
+        "socket",
+        "sockets",
+        "eval",
+        "exec",
+        "__import__",
+    }
+)
+
+# Matches any forbidden name as a whole word anywhere in the source text.
+_FORBIDDEN_RE: Final = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(name) for name in sorted(FORBIDDEN_NAMES, key=len, reverse=True))
+    + r")\b"
+)
+
+# Import statements the text-only fast path understands: one plain ``import``
+# or ``from ... import`` per line, optionally followed by a comment.
+_IMPORT_LINE_RE: Final = re.compile(
+    r"^[ \t]*(?:from[ \t]+([\w.]+)[ \t]+import[ \t]+[\w \t,*]+|import[ \t]+([\w. \t,]+))"
+    r"[ \t]*(?:#.*)?$",
+    re.MULTILINE,
+)
+_IMPORT_WORD_RE: Final = re.compile(r"\bimport\b")
+_FAST_PATH_MAX_IMPORTS: Final = 8
+
+# Parse straight to an AST, constant-folded where the interpreter supports it
+# (Python 3.13+), which leaves fewer nodes for the security walk.
+_AST_FLAGS: Final = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZED_AST", 0)
+
+# Validation outcomes keyed by a digest of the source: ``None`` for a source
+# that passed, otherwise the ``ValueError`` message to replay.
+_VALIDATION_CACHE_SIZE: Final = 256
+_validation_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_validation_lock = threading.Lock()
+
+# Loaded user-model modules keyed by the same source digest, least recently
+# used first. Evicted modules are also dropped from ``sys.modules``.
+_MODULE_CACHE_SIZE: Final = _VALIDATION_CACHE_SIZE
+_MODULE_CACHE: "OrderedDict[bytes, ModuleType]" = OrderedDict()
+_module_lock = threading.Lock()
+
+
+def _columns(records: Any) -> Optional[Dict[str, Any]]:
+    """Transpose a list of same-type dataclasses into one column per field.
+
+    Returns ``None`` when ``records`` is not such a list. Columns whose values
+    are all ``numpy`` arrays of one shape are stacked into a single array.
+    """
+    if not records or not isinstance(records, (list, tuple)):
+        return None
+    first = records[0]
+    record_type = type(first)
+    if not is_dataclass(first) or isinstance(first, type):
+        return None
+    if any(type(record) is not record_type for record in records):
+        return None
+    columns: Dict[str, Any] = {}
+    for field in fields(first):
+        column = [getattr(record, field.name) for record in records]
+        if np is not None and all(isinstance(item, np.ndarray) for item in column):
+            try:
+                columns[field.name] = np.stack(column)
+                continue
+            except ValueError:
+                pass
+        columns[field.name] = column
+    return columns
+
+
+def _enter(container: Any, path: FrozenSet[int], entered: list) -> FrozenSet[int]:
+    """Return ``path`` extended by ``container``, rejecting reference cycles.
+
+    ``container`` is appended to ``entered``, which the caller keeps for the
+    whole walk: temporary containers (such as the column lists built by
+    :func:`_columns`) must stay alive so their ids are never reused.
+    """
+    if id(container) in path:
+        raise ValueError("Circular reference detected in result")
+    entered.append(container)
+    return path | {id(container)}
 
-CONDOR_PACKAGE_PREFIX = "condor"
 
-ALLOWED_IMPORTS = {"condor", "math", "numpy", "dataclasses"}
-FORBIDDEN_NAMES = {
-    "open",
-    "os",
-    "sys",
-    "subprocess",
-    "socket",
-    "sockets",
-    "eval",
-    "exec",
-    "__import__",
-}
+def _to_primitive(obj: Any, keep_arrays: bool = False, columnar: bool = False) -> Any:
+    """Convert dataclasses and ``numpy`` arrays into primitives.
 
+    This helper ensures that results are JSON serialisable. ``numpy`` arrays
+    are transformed into Python lists unless ``keep_arrays`` is set, in which
+    case they are left for the JSON encoder to serialise natively. With
+    ``columnar`` set, lists of same-type dataclasses become a dict of columns
+    (see :func:`_columns`) instead of a list of per-record dicts.
+
+    The walk uses an explicit stack rather than recursion, and each output
+    container is created at its final size before its children are filled in.
+    A container that contains itself raises ``ValueError``.
+    """
+    root: list = [None]
+    # Each entry carries the ids of the containers enclosing it, so shared
+    # (but acyclic) references are still allowed.
+    stack: list = [(obj, root, 0, frozenset())]
+    entered: list = []
+    while stack:
+        value, parent, key, path = stack.pop()
+        if is_dataclass(value) and not isinstance(value, type):
+            path = _enter(value, path, entered)
+            names = [f.name for f in fields(value)]
+            out: Any = dict.fromkeys(names)
+            stack.extend((getattr(value, name), out, name, path) for name in names)
+        elif np is not None and isinstance(value, np.ndarray):
+            out = value if keep_arrays else value.tolist()
+        elif isinstance(value, dict):
+            path = _enter(value, path, entered)
+            out = dict.fromkeys(value)
+            stack.extend((v, out, k, path) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set)):
+            path = _enter(value, path, entered)
+            columns = _columns(value) if columnar else None
+            if columns is not None:
+                out = dict.fromkeys(columns)
+                stack.extend((v, out, k, path) for k, v in columns.items())
+            else:
+                out = [None] * len(value)
+                stack.extend((v, out, i, path) for i, v in enumerate(value))
+        else:
+            out = value
+        parent[key] = out
+    return root[0]
+
+
+def _json_default(obj: Any) -> Any:
+    if np is not None and isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
-def _to_primitive(obj: Any) -> Any:
-    """Recursively convert dataclasses and arrays into Python primitives."""
 
-def _dataclass_to_dict(obj: Any) -> Any:
-    """Recursively convert dataclasses and numpy arrays into primitives.
+def to_json_bytes(result: Any, columnar: bool = False) -> bytes:
+    """Serialise a Condor result to JSON bytes.
 
-    This helper ensures that results are JSON serialisable. ``numpy`` arrays
-    are transformed into Python lists.
+    With ``orjson`` installed, ``numpy`` arrays are encoded directly instead
+    of being converted element by element through ``ndarray.tolist()``.
+    ``columnar`` is forwarded to :func:`_to_primitive`.
     """
-    """Recursively convert dataclasses and ``numpy`` arrays into primitives."""
+    if orjson is None:
+        primitive = _to_primitive(result, columnar=columnar)
+        return json.dumps(primitive, default=_json_default).encode("utf-8")
+    return orjson.dumps(
+        _to_primitive(result, keep_arrays=True, columnar=columnar),
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """Raise ``ValueError`` on the first disallowed construct in a model AST."""
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.split(".")[0] not in ALLOWED_IMPORTS:
+                raise ValueError(f"Disallowed import: {alias.name}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if (node.module or "").split(".")[0] not in ALLOWED_IMPORTS:
+            raise ValueError(f"Disallowed import: {node.module}")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id in FORBIDDEN_NAMES:
+            raise ValueError(f"Forbidden call: {node.func.id}")
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id in FORBIDDEN_NAMES:
+            raise ValueError(f"Forbidden name: {node.id}")
 
-    """Recursively convert dataclasses and ``numpy`` arrays into primitives."""
-    """
-    Recursively convert dataclasses and ``numpy`` arrays into primitives suitable for JSON serialization.
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if node.attr.startswith("__"):
+            raise ValueError("Dunder attribute access is not allowed")
+        self.generic_visit(node)
 
-    This helper ensures that results are JSON serialisable. ``numpy`` arrays are transformed into Python lists.
-    """
-    if is_dataclass(obj):
-        return {k: _to_primitive(v) for k, v in asdict(obj).items()}
-    if np is not None and isinstance(obj, np.ndarray):
-        return obj.tolist()
-    if isinstance(obj, dict):
-        return {k: _to_primitive(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [_to_primitive(v) for v in obj]
-    return obj
 
+def _is_trivially_safe(py_text: str) -> bool:
+    """Return whether ``py_text`` passes validation on a text scan alone.
 
-def validate_model_source(py_text: str) -> None:
-    """Validate a user supplied model source string.
-
-    The validator performs a conservative static analysis using :mod:`ast`.
-    Only a small allow-list of imports is permitted and several dangerous
-    names are rejected.  The intent is to catch obvious misuse before
-    executing code in a sandbox.
-    The validator performs a conservative static analysis using ``ast``. Only
-    a small allow-list of imports is permitted and several dangerous names are
-    rejected. The intent is to catch obvious misuse before executing code in a
-    sandbox.
-    names are rejected. The intent is to catch obvious misuse before executing
-    code in a sandbox.
+    Sources qualify when they are ASCII (so no identifier can normalise into
+    a forbidden name), contain no forbidden token and no ``__``, and every
+    ``import`` keyword belongs to a simple allow-listed import line. Anything
+    else returns ``False`` and goes through the full AST walk.
+    """
+    if not py_text.isascii() or "__" in py_text or _FORBIDDEN_RE.search(py_text):
+        return False
+    imports = _IMPORT_LINE_RE.findall(py_text)
+    if len(imports) > _FAST_PATH_MAX_IMPORTS:
+        return False
+    if len(imports) != len(_IMPORT_WORD_RE.findall(py_text)):
+        return False
+    for from_module, import_names in imports:
+        if from_module:
+            modules = [from_module]
+        else:
+            modules = [part.split()[0] for part in import_names.split(",") if part.strip()]
+        if any(module.split(".")[0] not in ALLOWED_IMPORTS for module in modules):
+            return False
+    return True
+
+
+def _validate_impl(py_text: str) -> ast.Module:
+    """Run the static checks behind :func:`validate_model_source`.
+
+    Returns the parsed tree so callers can compile it without re-parsing.
     """
-FORBIDDEN_NAMES = {"open", "os", "sys", "subprocess", "socket", "eval", "exec"}
+    tree: ast.Module = compile(
+        py_text, "<user_model>", "exec", flags=_AST_FLAGS, dont_inherit=True
+    )
+    _SecurityVisitor().visit(tree)
 
+    match = _FORBIDDEN_RE.search(py_text)
+    if match:
+        raise ValueError(f"Forbidden token found: {match.group(0)}")
+    return tree
 
-def _normalise(value: Any) -> Any:
-    if is_dataclass(value):
-        return {k: _normalise(v) for k, v in asdict(value).items()}
-    if np is not None and isinstance(value, np.ndarray):  # pragma: no cover - optional
-        return value.tolist()
-    if isinstance(value, dict):
-        return {k: _normalise(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [_normalise(v) for v in value]
-    return value
 
+def _source_digest(py_text: str) -> bytes:
+    return hashlib.blake2b(py_text.encode("utf-8"), digest_size=16).digest()
+
+
+def _remember_validation(key: bytes, error: Optional[str]) -> None:
+    with _validation_lock:
+        _validation_cache[key] = error
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
 
-def validate_model_source(py_text: str) -> None:
-    """Perform a tiny security audit over ``py_text``."""
 
-    """Validate a user supplied model source string."""
+def _validated_tree(py_text: str, key: bytes) -> Optional[ast.Module]:
+    """Validate ``py_text`` through the outcome cache.
+
+    Returns the parsed tree when the source had to be parsed, or ``None`` when
+    it was accepted without parsing (cached or trivially safe).
+    """
+    with _validation_lock:
+        if key in _validation_cache:
+            _validation_cache.move_to_end(key)
+            error = _validation_cache[key]
+            if error is not None:
+                raise ValueError(error)
+            return None
+
+    if _is_trivially_safe(py_text):
+        _remember_validation(key, None)
+        return None
+    try:
+        tree = _validate_impl(py_text)
+    except ValueError as exc:
+        _remember_validation(key, str(exc))
+        raise
+    _remember_validation(key, None)
+    return tree
+
+
+def validate_model_source(py_text: str) -> None:
     """
     Validate user-supplied model source code using conservative static analysis.
 
@@ -162,67 +311,33 @@ def validate_model_source(py_text: str) -> None:
     small allow-list, and rejects several dangerous names and dunder attribute
     access. Any disallowed construct raises ``ValueError`` to prevent unsafe
     execution when loading user models.
-    """
-    tree = ast.parse(py_text)
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                if alias.name.split(".")[0] not in ALLOWED_IMPORTS:
-                    raise ValueError(f"Disallowed import: {alias.name}")
-        elif isinstance(node, ast.ImportFrom):
-            if (node.module or "").split(".")[0] not in ALLOWED_IMPORTS:
-                raise ValueError(f"from '{node.module}' import is not allowed")
-        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            if node.func.id in FORBIDDEN_NAMES:
-                raise ValueError(f"Forbidden call: {node.func.id}")
-        elif isinstance(node, ast.Name):
-            if node.id in FORBIDDEN_NAMES:
-                raise ValueError(f"use of '{node.id}' is forbidden")
-        elif isinstance(node, ast.Attribute):
-            if node.attr.startswith("__"):
-                raise ValueError("dunder attribute access is forbidden")
-                raise ValueError(f"usage of '{node.id}' is forbidden")
-        elif isinstance(node, ast.Attribute) and node.attr.startswith("__"):
-            raise ValueError("Dunder attribute access is not allowed")
-
-    for token in FORBIDDEN_NAMES:
-        if token in py_text:
-            raise ValueError(f"forbidden token found: {token}")
-
-            root = (node.module or "").split(".")[0]
-            if root not in ALLOWED_IMPORTS:
-                raise ValueError(f"Disallowed import: {node.module}")
-        elif isinstance(node, ast.Name) and node.id in FORBIDDEN_NAMES:
-            raise ValueError(f"Forbidden name: {node.id}")
-
-    for forbidden in FORBIDDEN_NAMES:
-        if forbidden in py_text:
-            raise ValueError(f"Forbidden token found: {forbidden}")
 
-
-def _load_module(py_text: str, module_name: str) -> ModuleType:
-def _load_module_from_source(source: str, module_name: str) -> ModuleType:
-    """Load a module from source text in an isolated temporary directory."""
-    with tempfile.TemporaryDirectory() as tmp:
-        path = Path(tmp) / f"{module_name}.py"
-        path.write_text(py_text, encoding="utf-8")
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        if spec is None or spec.loader is None:  # pragma: no cover - defensive
-            raise ImportError("Unable to create import spec")
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        return module
+    Outcomes are memoised by a digest of ``py_text`` so re-submitting the same
+    source skips the parse and tree walk. Sources that a text scan already
+    proves safe are accepted without parsing, so syntax errors in them only
+    surface when the model is loaded.
+    """
+    _validated_tree(py_text, _source_digest(py_text))
+
+
+def _load_module_from_source(source: str | ast.Module, module_name: str) -> ModuleType:
+    """Compile ``source`` (text or an already parsed tree) into a new module."""
+    filename = f"<{module_name}>"
+    # dont_inherit: this module's ``from __future__ import annotations``
+    # must not turn the user model's annotations into strings.
+    code = compile(source, filename, "exec", dont_inherit=True)
+    module = ModuleType(module_name)
+    module.__file__ = filename
+    sys.modules[module_name] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
 
 
 def load_model_from_source(py_text: str, class_name: str) -> Type[Any]:
-    """Validate and load a model class from source code."""
-
-    validate_model_source(py_text)
-    module = _load_module_from_source(py_text, "user_model")
-    return getattr(module, class_name)
-
-    """Validate ``py_text`` and return ``class_name`` from it."""
     """
     Validate and load a model class from source code.
 
@@ -247,60 +362,36 @@ def load_model_from_source(py_text: str, class_name: str) -> Type[Any]:
     AttributeError
         If the specified class is not found in the loaded module.
 
-    This function first validates the provided source code for safety,
-    then loads it as a module in an isolated temporary directory,
-    and finally returns the specified class object from the module.
+    Loaded modules are cached by source digest, so repeated calls with the
+    same ``py_text`` return classes from the same module object.
     """
-    validate_model_source(py_text)
-    module = _load_module_from_source(py_text, "user_model")
-    return getattr(module, class_name)
+    key = _source_digest(py_text)
+    # Held across the load so concurrent callers never exec one source twice.
+    with _module_lock:
+        module = _MODULE_CACHE.get(key)
+        if module is None:
+            tree = _validated_tree(py_text, key)
+            source = py_text if tree is None else tree
+            module = _load_module_from_source(source, f"user_model_{key.hex()[:12]}")
+            _MODULE_CACHE[key] = module
+            if len(_MODULE_CACHE) > _MODULE_CACHE_SIZE:
+                _, evicted = _MODULE_CACHE.popitem(last=False)
+                sys.modules.pop(evicted.__name__, None)
+        else:
+            _MODULE_CACHE.move_to_end(key)
+    model_cls: Type[Any] = getattr(module, class_name)
+    return model_cls
 
-    validate_model_source(py_text)
-    module = _load_module(py_text, "condor_user_model")
-    return getattr(module, class_name)
 
-def solve_algebraic(model_cls: Type[Any], **params: Any) -> Any:
+def solve_algebraic(model_cls: Type[Any], **params: Any) -> Dict[str, Any]:
     """Instantiate ``model_cls`` and call its ``solve`` method.
 
     The returned object is converted to basic Python types so that it is
-    easy to serialise to JSON.  When the real Condor library is absent,
+    easy to serialise to JSON. When the real Condor library is absent,
     models that originate from the ``condor`` package cannot be
-    instantiated and a :class:`RuntimeError` is raised.  User supplied
+    instantiated and a :class:`RuntimeError` is raised. User supplied
     models remain supported even without Condor installed.
-def solve_algebraic(model_cls: Type[Any], **params: Any) -> Dict[str, Any]:
-    """Instantiate ``model_cls`` and call its ``solve`` method.
-
-    The returned object is converted to basic Python types so that it is
-    easy to serialise to JSON.
-    The helper instantiates ``model_cls`` with ``params`` and calls its
-    ``solve`` method. Results are converted into a JSON-friendly dictionary.
-    This function does not require the Condor package to be installed; it only
-    relies on the behaviour of the provided model class.
-    """
-def solve_algebraic(model_cls: Type[Any], **params: Any) -> Dict[str, Any]:
-    """Solve a Condor ``AlgebraicSystem`` model."""
-
-    if condor is None and model_cls.__module__.split(".")[0] == "condor":
-    """Solve a Condor ``AlgebraicSystem`` model."""
-    """
-    Instantiates the given Condor ``AlgebraicSystem`` model class with the provided parameters,
-    calls its ``solve`` method, and returns the results as a JSON-friendly dictionary.
-
-    Parameters
-    ----------
-    model_cls : Type[Any]
-        The Condor model class to instantiate (should be a subclass of ``AlgebraicSystem``).
-    **params : Any
-        Keyword arguments to pass to the model class constructor.
-
-    Returns
-    -------
-    Dict[str, Any]
-        The solution returned by ``model.solve()``, converted to a JSON-serializable dictionary.
     """
-    if condor is None:  # pragma: no cover - runtime guard
-        raise RuntimeError("Condor is not installed")
-
     if condor is None and model_cls.__module__.split(".")[0] == CONDOR_PACKAGE_PREFIX:
         raise RuntimeError(
             "Condor is not installed. Install it with: pip install condor\n"
@@ -309,103 +400,47 @@ def solve_algebraic(model_cls: Type[Any], **params: Any) -> Dict[str, Any]:
 
     model = model_cls(**params)
     result = model.solve() if hasattr(model, "solve") else model
-    return _to_primitive(result)
-    model = model_cls(**params)
-    result = model.solve() if hasattr(model, "solve") else model
-    return _dataclass_to_dict(result)
-    model = model_cls(**params)
-    result = model.solve() if hasattr(model, "solve") else model
-    return _normalise(result)
-    model = model_cls(**params)
-    solution = model.solve() if hasattr(model, "solve") else model
-    return _dataclass_to_dict(solution)
+    output: Dict[str, Any] = _to_primitive(result)
+    return output
 
 
 def simulate_ode(
     model_cls: Type[Any],
     t_final: float,
-    initial: Any,
+    initial: Dict[str, Any],
     params: Optional[Dict[str, Any]] = None,
     events: Any = None,
     modes: Any = None,
-) -> Any:
-    """Simulate an ODE system if the model exposes a ``simulate`` method."""
-    initial: Dict[str, Any],
-    params: Dict[str, Any] | None = None,
-    events: Any | None = None,
-    modes: Any | None = None,
+    columnar: bool = False,
 ) -> Dict[str, Any]:
-    """Simulate an ``ODESystem`` until ``t_final``."""
-    """Simulate an ``ODESystem`` until ``t_final`` if the model supports it."""
+    """Simulate an ``ODESystem`` until ``t_final`` if the model supports it.
 
+    Pass ``columnar=True`` to receive a trajectory of per-step dataclasses as
+    one list (or stacked array) per field rather than one dict per step.
+    """
     model = model_cls(**(params or {}))
     if hasattr(model, "simulate"):
         result = model.simulate(t_final, initial, events=events, modes=modes)
     else:  # pragma: no cover - dummy fallback for tests
         result = {}
-    return _to_primitive(result)
-    else:  # pragma: no cover - dummy fallback
-        result = {}
-    return _dataclass_to_dict(result)
-    params: Dict[str, Any],
-    *,
-    events: Any | None = None,
-    modes: Any | None = None,
-) -> Dict[str, Any]:
-
-    """
-    Simulate an ``ODESystem`` until ``t_final``.
-
-    Forwards to the model's ``simulate`` method and returns results
-    serialised via :func:`_dataclass_to_dict`.
-    The output is a serialisable dictionary.
-    """
-    if condor is None:  # pragma: no cover - runtime guard
-        raise RuntimeError("Condor is not installed")
-    model = model_cls(**params)
-    if not hasattr(model, "simulate"):
-        raise RuntimeError("Model does not implement simulate()")
-    result = model.simulate(t_final, initial, events=events, modes=modes)
-    return _normalise(result)
+    output: Dict[str, Any] = _to_primitive(result, columnar=columnar)
+    return output
 
 
 def optimize(
     problem_cls: Type[Any],
-    initial_guess: Any,
-    bounds: Any = None,
-    options: Optional[Dict[str, Any]] = None,
-) -> Any:
     initial_guess: Dict[str, Any],
-    bounds: Dict[str, Any] | None = None,
-    options: Dict[str, Any] | None = None,
+    bounds: Optional[Dict[str, Any]] = None,
+    options: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Solve an optimisation problem if ``problem_cls`` implements ``solve``."""
-
-    """Solve an ``OptimizationProblem`` and return a serialisable dictionary."""
-    if condor is None:  # pragma: no cover - runtime guard
-        raise RuntimeError("Condor is not installed")
     problem = problem_cls()
     if hasattr(problem, "solve"):
         result = problem.solve(initial_guess, bounds=bounds, options=options)
     else:  # pragma: no cover - dummy fallback
         result = {}
-    return _to_primitive(result)
-
-
-__all__ = [
-    "load_model_from_source",
-    "optimize",
-    "simulate_ode",
-    "solve_algebraic",
-    "validate_model_source",
-]
-    result = problem.solve(initial_guess=initial_guess, bounds=bounds, options=options)
-    return _dataclass_to_dict(result)
-    problem = problem_cls()
-    if not hasattr(problem, "solve"):
-        raise RuntimeError("Problem does not implement solve()")
-    result = problem.solve(initial_guess, bounds=bounds, options=options)
-    return _normalise(result)
+    output: Dict[str, Any] = _to_primitive(result)
+    return output
 
 
 __all__ = [
@@ -415,4 +450,5 @@ __all__ = [
     "solve_algebraic",
     "simulate_ode",
     "optimize",
+    "to_json_bytes",
 ]
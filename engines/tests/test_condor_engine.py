@@ -0,0 +1,194 @@
+"""Unit tests for the Condor engine helpers."""
+
+from __future__ import annotations
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lucidia.engines import condor_engine
+from lucidia.engines.condor_engine import (
+    load_model_from_source,
+    simulate_ode,
+    solve_algebraic,
+    to_json_bytes,
+    validate_model_source,
+)
+
+MODEL_SOURCE = '''
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class Result:
+    x: float
+    converged: bool
+
+
+class Model:
+    def __init__(self, a=1.0):
+        self.a = a
+
+    def solve(self):
+        return Result(x=math.sqrt(self.a), converged=True)
+'''
+
+
+def test_load_and_solve_user_model() -> None:
+    model_cls = load_model_from_source(MODEL_SOURCE, "Model")
+    assert solve_algebraic(model_cls, a=9.0) == {"x": 3.0, "converged": True}
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "import subprocess\n",
+        "from socket import socket\n",
+        "value = eval('1')\n",
+        "value = ().__class__\n",
+    ],
+)
+def test_validate_rejects_unsafe_sources(source: str) -> None:
+    with pytest.raises(ValueError):
+        validate_model_source(source)
+
+
+def test_validation_outcome_is_memoised() -> None:
+    source = "import subprocess  # memoised\n"
+    with pytest.raises(ValueError) as first:
+        validate_model_source(source)
+    with pytest.raises(ValueError) as second:
+        validate_model_source(source)
+    assert str(first.value) == str(second.value)
+    assert len(condor_engine._validation_cache) <= condor_engine._VALIDATION_CACHE_SIZE
+
+
+def test_identical_sources_share_one_loaded_module() -> None:
+    first = load_model_from_source(MODEL_SOURCE, "Model")
+    second = load_model_from_source(MODEL_SOURCE, "Model")
+    assert first is second
+    assert first.__module__.startswith("user_model_")
+
+
+def test_module_cache_evicts_least_recently_used_sources(monkeypatch) -> None:
+    monkeypatch.setattr(condor_engine, "_MODULE_CACHE", condor_engine.OrderedDict())
+    monkeypatch.setattr(condor_engine, "_MODULE_CACHE_SIZE", 2)
+    sources = [f"{MODEL_SOURCE}\nVERSION = {i}\n" for i in range(3)]
+    first = load_model_from_source(sources[0], "Model")
+    load_model_from_source(sources[1], "Model")
+    assert load_model_from_source(sources[0], "Model") is first
+    load_model_from_source(sources[2], "Model")  # evicts sources[1]
+    evicted = condor_engine._source_digest(sources[1])
+    assert evicted not in condor_engine._MODULE_CACHE
+    assert f"user_model_{evicted.hex()[:12]}" not in sys.modules
+    assert first.__module__ in sys.modules
+
+
+def test_concurrent_loads_of_one_source_share_a_module() -> None:
+    source = f"{MODEL_SOURCE}\nTHREADED = True\n"
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        classes = list(pool.map(lambda _: load_model_from_source(source, "Model"), range(16)))
+    assert all(cls is classes[0] for cls in classes)
+
+
+# The parenthesised import skips the text-only fast path, so the model is
+# compiled from its parsed AST instead of from text.
+@pytest.mark.parametrize(
+    "import_line", ["from dataclasses import dataclass", "from dataclasses import (dataclass)"]
+)
+def test_user_model_annotations_stay_real_types(import_line: str) -> None:
+    import dataclasses
+
+    source = (
+        f"{import_line}\n\n\n"
+        "@dataclass\n"
+        "class Model:\n"
+        "    n: int = 1\n"
+    )
+    model_cls = load_model_from_source(source, "Model")
+    assert dataclasses.fields(model_cls)[0].type is int
+
+
+def test_forbidden_tokens_match_whole_words_only() -> None:
+    validate_model_source("import math\n\nangle = math.cos(0.0)\n")
+    with pytest.raises(ValueError, match="Forbidden token found: sys"):
+        validate_model_source("name = 'sys'\n")
+
+
+def test_to_json_bytes_serialises_arrays_and_dataclasses() -> None:
+    np = pytest.importorskip("numpy")
+    from dataclasses import dataclass
+
+    @dataclass
+    class Trajectory:
+        t: object
+        label: str
+
+    result = {"run": Trajectory(t=np.array([0.0, 0.5, 1.0]), label="ok")}
+    assert json.loads(to_json_bytes(result)) == {"run": {"t": [0.0, 0.5, 1.0], "label": "ok"}}
+
+
+def test_to_json_bytes_rejects_cycles_but_allows_shared_values() -> None:
+    shared = [1, 2]
+    assert json.loads(to_json_bytes({"a": shared, "b": [shared, shared]})) == {
+        "a": [1, 2],
+        "b": [[1, 2], [1, 2]],
+    }
+    cyclic: dict = {}
+    cyclic["self"] = [cyclic]
+    with pytest.raises(ValueError, match="Circular reference"):
+        to_json_bytes(cyclic)
+
+
+def test_columnar_walk_accepts_nested_lists_of_dataclasses() -> None:
+    from dataclasses import dataclass
+
+    @dataclass
+    class Inner:
+        value: float
+
+    @dataclass
+    class Step:
+        t: float
+        sub: list
+
+    steps = [Step(t=float(i), sub=[Inner(i * 0.5), Inner(i * 2.0)]) for i in range(50)]
+    for _ in range(20):
+        decoded = json.loads(to_json_bytes({"trajectory": steps}, columnar=True))
+    assert decoded["trajectory"]["t"] == [float(i) for i in range(50)]
+    assert decoded["trajectory"]["sub"][3] == {"value": [1.5, 6.0]}
+
+
+def test_simulate_ode_columnar_transposes_step_records() -> None:
+    from dataclasses import dataclass
+
+    @dataclass
+    class Step:
+        t: float
+        x: float
+
+    class Model:
+        def simulate(self, t_final, initial, events=None, modes=None):
+            return {"steps": [Step(t=0.0, x=initial["x"]), Step(t=t_final, x=2.0)]}
+
+    rows = simulate_ode(Model, 1.0, {"x": 1.0})
+    assert rows == {"steps": [{"t": 0.0, "x": 1.0}, {"t": 1.0, "x": 2.0}]}
+    columns = simulate_ode(Model, 1.0, {"x": 1.0}, columnar=True)
+    assert columns == {"steps": {"t": [0.0, 1.0], "x": [1.0, 2.0]}}
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "x = 1; import socket\n",
+        "from math import (\n    sqrt,\n)\nimport subprocess as sp\n",
+        "ｅｖａｌ('1')\n",  # fullwidth "eval" normalises to eval
+    ],
+)
+def test_text_fast_path_defers_unusual_sources_to_the_ast_walk(source: str) -> None:
+    assert not condor_engine._is_trivially_safe(source)
+    with pytest.raises(ValueError):
+        validate_model_source(source)
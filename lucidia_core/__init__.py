@@ -2,37 +2,47 @@
 
 __version__ = "0.1.0"
 
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Package root for accessing agent modules
 PACKAGE_ROOT = Path(__file__).parent.parent
 
+
+def _ensure_agent_path():
+    """Make the top-level agent modules importable, adding the path only once."""
+    root = str(PACKAGE_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
 # Import main agent classes for convenience
+@lru_cache(maxsize=None)
 def get_physicist():
     """Get the Physicist reasoning engine."""
-    import sys
-    sys.path.insert(0, str(PACKAGE_ROOT))
+    _ensure_agent_path()
     from physicist import PhysicistSeed, load_seed
     return PhysicistSeed, load_seed
 
+@lru_cache(maxsize=None)
 def get_mathematician():
     """Get the Mathematician reasoning engine."""
-    import sys
-    sys.path.insert(0, str(PACKAGE_ROOT))
+    _ensure_agent_path()
     from mathematician import MathematicianSeed, load_seed
     return MathematicianSeed, load_seed
 
+@lru_cache(maxsize=None)
 def get_chemist():
     """Get the Chemist reasoning engine."""
-    import sys
-    sys.path.insert(0, str(PACKAGE_ROOT))
+    _ensure_agent_path()
     from chemist import ChemistSeed, load_seed
     return ChemistSeed, load_seed
 
+@lru_cache(maxsize=None)
 def get_geologist():
     """Get the Geologist reasoning engine."""
-    import sys
-    sys.path.insert(0, str(PACKAGE_ROOT))
+    _ensure_agent_path()
     from geologist import GeologistSeed, load_seed
     return GeologistSeed, load_seed
 
@@ -11,15 +11,40 @@ Provides REST endpoints for each specialized agent:
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import json
+import os
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel
 
-# Add parent to path for agent imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:  # Optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+from lucidia_core import get_chemist, get_geologist, get_mathematician, get_physicist
+
+# Cached agent loaders, warmed at startup so no request pays the import.
+AGENTS = {
+    "physicist": get_physicist,
+    "mathematician": get_mathematician,
+    "chemist": get_chemist,
+    "geologist": get_geologist,
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Import the agent modules once before serving requests."""
+    for loader in AGENTS.values():
+        try:
+            loader()
+        except ImportError:
+            pass  # reported by the endpoint that needs the agent
+    yield
+
 
 app = FastAPI(
     title="Lucidia API",
@@ -27,6 +52,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 
@@ -54,25 +80,30 @@ class HealthResponse(BaseModel):
 
 
 # Health endpoint
-@app.get("/health", response_model=HealthResponse)
+_HEALTH = {
+    "status": "healthy",
+    "agents": [
+        "physicist",
+        "mathematician",
+        "chemist",
+        "geologist",
+        "analyst",
+        "architect",
+        "engineer",
+        "painter",
+        "poet",
+        "speaker",
+    ],
+    "version": "0.1.0",
+}
+# The payload never changes, so it is serialised once at import time.
+_HEALTH_JSON = orjson.dumps(_HEALTH) if orjson is not None else json.dumps(_HEALTH).encode()
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health():
     """Check API health and list available agents."""
-    return HealthResponse(
-        status="healthy",
-        agents=[
-            "physicist",
-            "mathematician",
-            "chemist",
-            "geologist",
-            "analyst",
-            "architect",
-            "engineer",
-            "painter",
-            "poet",
-            "speaker",
-        ],
-        version="0.1.0",
-    )
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 # Physicist endpoints
@@ -80,7 +111,7 @@ async def health():
 async def physicist_analyze(request: AgentRequest):
     """Analyze physics-related query using the Physicist agent."""
     try:
-        from physicist import PhysicistSeed
+        AGENTS["physicist"]()
         return AgentResponse(
             agent="physicist",
             result={"query": request.query, "status": "analysis_pending"},
@@ -171,10 +202,32 @@ async def architect_design(request: AgentRequest):
     )
 
 
-def run():
-    """Run the API server."""
+def serve(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """Serve the API with uvicorn.
+
+    uvicorn's ``auto`` loop and HTTP settings pick uvloop and httptools when
+    they are installed (``uvicorn[standard]``). Access logging is disabled.
+    ``workers`` defaults to ``WEB_CONCURRENCY``, or one worker per CPU.
+    """
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    if workers is None:
+        workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run(
+        "lucidia_core.api:app",
+        host=host,
+        port=port,
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,
+        workers=workers,
+    )
+
+
+def run():
+    """Run the API server with the default settings."""
+    serve()
 
 
 if __name__ == "__main__":
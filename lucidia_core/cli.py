@@ -3,15 +3,155 @@
 from __future__ import annotations
 
 import argparse
+import shlex
 import sys
-from pathlib import Path
 
-# Add parent to path for agent imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def _agent_catalog():
+    """Return ``(name, description)`` pairs for every Lucidia agent."""
+    return [
+        ("physicist", "Physics simulations, energy modeling, force calculations"),
+        ("mathematician", "Mathematical computations, proofs, symbolic math"),
+        ("chemist", "Chemical analysis, reactions, molecular structures"),
+        ("geologist", "Geological analysis, terrain modeling, stratigraphy"),
+        ("analyst", "Data analysis, pattern recognition, insights"),
+        ("architect", "System design, blueprints, architecture planning"),
+        ("engineer", "Engineering calculations, structural analysis"),
+        ("painter", "Visual generation, graphics, artistic rendering"),
+        ("poet", "Creative text, poetry, lyrical composition"),
+        ("speaker", "Speech synthesis, NLP, communication"),
+        ("navigator", "Pathfinding, navigation, route optimization"),
+        ("researcher", "Research synthesis, literature review"),
+        ("mediator", "Coordination, conflict resolution"),
+        ("builder", "Build systems, construction planning"),
+    ]
+
+
+# Agent name -> module providing its ``main()``; imported only when run.
+AGENT_REGISTRY = {
+    "physicist": "physicist",
+    "mathematician": "mathematician",
+    "chemist": "chemist",
+    "geologist": "geologist",
+    "analyst": "analyst",
+    "architect": "architect",
+    "engineer": "engineer",
+    "painter": "painter",
+    "poet": "poet",
+    "speaker": "speaker",
+    "navigator": "navigator",
+    "researcher": "researcher",
+    "mediator": "mediator",
+    "builder": "builder",
+}
+
+
+def _cached_import(module_name, attr):
+    """Return ``attr`` from ``module_name``, importing the module only once."""
+    modules = sys.modules
+    if module_name not in modules:
+        __import__(module_name)
+    return getattr(modules[module_name], attr)
+
+
+def _add_list_parser(subparsers):
+    subparsers.add_parser("list", help="List available agents")
+
+
+def _add_run_parser(subparsers):
+    run_parser = subparsers.add_parser("run", help="Run a specific agent")
+    run_parser.add_argument("agent", help="Agent name (physicist, mathematician, etc.)")
+    run_parser.add_argument("--query", "-q", help="Query to process")
+    run_parser.add_argument("--seed", "-s", help="Path to seed YAML file")
 
 
-def main():
+def _add_api_parser(subparsers):
+    api_parser = subparsers.add_parser("api", help="Start the API server")
+    api_parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
+    api_parser.add_argument("--port", "-p", type=int, default=8000, help="Port to bind")
+    api_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: $WEB_CONCURRENCY or one per CPU)",
+    )
+
+
+def _add_shell_parser(subparsers):
+    subparsers.add_parser("shell", help="Run several commands in one warm process")
+
+
+_SUBCOMMANDS = {
+    "list": _add_list_parser,
+    "run": _add_run_parser,
+    "api": _add_api_parser,
+    "shell": _add_shell_parser,
+}
+
+
+def _shell():
+    """Read ``lucidia`` commands from stdin and run them in this process.
+
+    Agents imported by one ``run`` stay in ``sys.modules``, so later runs skip
+    interpreter start-up and the agent's own imports.
+    """
+    print("Lucidia shell: enter commands such as 'list' or 'run physicist'; 'exit' quits.")
+    while True:
+        try:
+            line = input("lucidia> ")
+        except EOFError:
+            print()
+            return
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        try:
+            words = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}")
+            continue
+        if not words:
+            continue
+        if words[0] in ("exit", "quit"):
+            return
+        if words[0] == "shell":
+            print("Already in the Lucidia shell")
+            continue
+
+        # Agents parse sys.argv themselves; show them what a fresh process would.
+        saved_argv = sys.argv
+        sys.argv = ["lucidia", *words]
+        try:
+            main(words)
+        except SystemExit:
+            pass
+        except KeyboardInterrupt:
+            print()
+        except Exception as e:
+            print(f"Error: {e}")
+        finally:
+            sys.argv = saved_argv
+
+
+def _sniff_subcommand(argv):
+    """Return the subcommand named by ``argv``, or ``None`` if there is none.
+
+    Only the first argument is inspected; anything else (no arguments,
+    ``--help``, a typo) falls back to building every subparser so help and
+    error messages stay complete.
+    """
+    if argv and argv[0] in _SUBCOMMANDS:
+        return argv[0]
+    return None
+
+
+def main(argv=None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         prog="lucidia",
         description="Lucidia: AI reasoning engines for specialized domains",
@@ -19,42 +159,18 @@ def main():
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # List agents
-    list_parser = subparsers.add_parser("list", help="List available agents")
-
-    # Run agent
-    run_parser = subparsers.add_parser("run", help="Run a specific agent")
-    run_parser.add_argument("agent", help="Agent name (physicist, mathematician, etc.)")
-    run_parser.add_argument("--query", "-q", help="Query to process")
-    run_parser.add_argument("--seed", "-s", help="Path to seed YAML file")
-
-    # API server
-    api_parser = subparsers.add_parser("api", help="Start the API server")
-    api_parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
-    api_parser.add_argument("--port", "-p", type=int, default=8000, help="Port to bind")
+    # Only build the subparser that will actually be used
+    command = _sniff_subcommand(argv)
+    for name, add_parser in _SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_parser(subparsers)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "list":
         print("Available Lucidia agents:")
         print()
-        agents = [
-            ("physicist", "Physics simulations, energy modeling, force calculations"),
-            ("mathematician", "Mathematical computations, proofs, symbolic math"),
-            ("chemist", "Chemical analysis, reactions, molecular structures"),
-            ("geologist", "Geological analysis, terrain modeling, stratigraphy"),
-            ("analyst", "Data analysis, pattern recognition, insights"),
-            ("architect", "System design, blueprints, architecture planning"),
-            ("engineer", "Engineering calculations, structural analysis"),
-            ("painter", "Visual generation, graphics, artistic rendering"),
-            ("poet", "Creative text, poetry, lyrical composition"),
-            ("speaker", "Speech synthesis, NLP, communication"),
-            ("navigator", "Pathfinding, navigation, route optimization"),
-            ("researcher", "Research synthesis, literature review"),
-            ("mediator", "Coordination, conflict resolution"),
-            ("builder", "Build systems, construction planning"),
-        ]
-        for name, desc in agents:
+        for name, desc in _agent_catalog():
             print(f"  {name:15} - {desc}")
         print()
 
@@ -63,24 +179,28 @@ def main():
         print(f"Loading {agent_name} agent...")
 
         try:
-            if agent_name == "physicist":
-                from physicist import main as agent_main
-                agent_main()
-            elif agent_name == "mathematician":
-                from mathematician import main as agent_main
-                agent_main()
-            else:
+            from lucidia_core import _ensure_agent_path
+
+            # Agent modules live next to the package; only ``run`` needs them.
+            _ensure_agent_path()
+            module_name = AGENT_REGISTRY.get(agent_name)
+            if module_name is None:
                 print(f"Agent '{agent_name}' not yet implemented for CLI mode")
                 sys.exit(1)
+            agent_main = _cached_import(module_name, "main")
+            agent_main()
         except ImportError as e:
             print(f"Error loading agent: {e}")
             sys.exit(1)
 
     elif args.command == "api":
         print(f"Starting Lucidia API on {args.host}:{args.port}")
-        import uvicorn
-        from lucidia_core.api import app
-        uvicorn.run(app, host=args.host, port=args.port)
+        from lucidia_core.api import serve
+
+        serve(host=args.host, port=args.port, workers=args.workers)
+
+    elif args.command == "shell":
+        _shell()
 
     else:
         parser.print_help()
@@ -16,6 +16,9 @@ except Exception:  # pragma: no cover - fallback implementation
     _PegasosQSVC = None  # type: ignore
     QuantumKernel = None  # type: ignore
 
+# Upper bound on the elements of the difference buffer built per predict block.
+_PREDICT_BLOCK_ELEMENTS = 1 << 20
+
 
 @dataclass
 class _NearestNeighborQSVC:
@@ -32,13 +35,18 @@ class _NearestNeighborQSVC:
     def predict(self, x: np.ndarray) -> np.ndarray:
         if self.training_x is None or self.training_y is None:
             raise RuntimeError("Model has not been fitted")
-        x = np.asarray(x)
-        preds = []
-        for row in x:
-            distances = np.linalg.norm(self.training_x - row, axis=1)
-            index = int(np.argmin(distances))
-            preds.append(int(self.training_y[index]))
-        return np.asarray(preds)
+        x = np.asarray(x, dtype=float)
+        train = np.asarray(self.training_x, dtype=float)
+        # Exact squared differences: the |a|^2 + |b|^2 - 2 a.b expansion loses
+        # the distances to cancellation whenever features dwarf their gaps.
+        # Rows are processed in blocks so the (rows, N, D) buffer stays bounded;
+        # sqrt is skipped as it does not change the argmin.
+        rows = max(1, _PREDICT_BLOCK_ELEMENTS // max(1, train.size))
+        nearest = np.empty(len(x), dtype=np.intp)
+        for start in range(0, len(x), rows):
+            diff = x[start : start + rows, None, :] - train[None, :, :]
+            nearest[start : start + rows] = np.argmin(np.einsum("ijk,ijk->ij", diff, diff), axis=1)
+        return self.training_y[nearest].astype(int)
 
 
 def fit_qsvc(
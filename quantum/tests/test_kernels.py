@@ -0,0 +1,32 @@
+"""Tests for the NumPy nearest-neighbour fallback in ``lucidia.quantum.kernels``."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+# ``lucidia.quantum`` imports Qiskit at package level; the fallback itself
+# only needs NumPy, so torch and qiskit_machine_learning are not required.
+pytest.importorskip("qiskit")
+
+from lucidia.quantum import kernels  # noqa: E402
+from lucidia.quantum.kernels import _NearestNeighborQSVC  # noqa: E402
+
+
+def test_nearest_neighbor_handles_large_magnitude_features():
+    x = np.array([[0.0, 0.0], [1e9, 0.0], [1e9 + 1.0, 0.0]])
+    y = np.array([0, 1, 2])
+    model = _NearestNeighborQSVC().fit(x, y)
+    preds = model.predict(np.array([[1e9 + 0.9, 0.0], [1e9 + 0.1, 0.0]]))
+    assert preds.tolist() == [2, 1]
+
+
+def test_nearest_neighbor_matches_bruteforce_across_blocks(monkeypatch):
+    monkeypatch.setattr(kernels, "_PREDICT_BLOCK_ELEMENTS", 7)
+    rng = np.random.default_rng(0)
+    train = rng.normal(size=(30, 3))
+    labels = rng.integers(0, 4, size=30)
+    queries = rng.normal(size=(50, 3))
+    expected = [labels[np.argmin(((train - q) ** 2).sum(axis=1))] for q in queries]
+    model = _NearestNeighborQSVC().fit(train, labels)
+    assert model.predict(queries).tolist() == expected
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import math
+import numbers
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Tuple, Union
 
 import numpy as np
 
@@ -27,6 +29,59 @@ class Point2D:
         return (self.x, self.y)
 
 
+@dataclass(eq=False)
+class Points2D:
+    """Collection of 2D points stored as one ``(N, 2)`` float array.
+
+    Iterating or indexing with an integer yields :class:`Point2D` objects, so
+    code written against ``List[Point2D]`` keeps working.
+    """
+
+    xy: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.xy = np.asarray(self.xy, dtype=float).reshape(-1, 2)
+
+    @property
+    def x(self) -> np.ndarray:
+        """X coordinates (a view into ``xy``)."""
+        return self.xy[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y coordinates (a view into ``xy``)."""
+        return self.xy[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def __iter__(self) -> Iterator[Point2D]:
+        for x, y in self.xy.tolist():
+            yield Point2D(x, y)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Point2D, Points2D]:
+        if isinstance(index, numbers.Integral):
+            x, y = self.xy[index].tolist()
+            return Point2D(x, y)
+        return Points2D(self.xy[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Points2D):
+            return NotImplemented
+        return bool(np.array_equal(self.xy, other.xy))
+
+    def distances_to(self, other: Union[Point2D, Tuple[float, float]]) -> np.ndarray:
+        """Euclidean distance from every point to ``other``."""
+        if isinstance(other, Point2D):
+            other = other.to_tuple()
+        delta = self.xy - np.asarray(other, dtype=float)
+        return np.sqrt(np.einsum("ij,ij->i", delta, delta))
+
+    def to_list(self) -> List[Point2D]:
+        """Convert to a list of :class:`Point2D`."""
+        return list(self)
+
+
 class FlowerOfLifeGenerator:
     """Generate Flower of Life sacred geometry pattern."""
 
@@ -34,30 +89,34 @@ class FlowerOfLifeGenerator:
         """Initialize with circle radius."""
         self.radius = radius
 
-    def generate_circles(self, layers: int = 3) -> List[Point2D]:
+    def generate_circles(self, layers: int = 3) -> Points2D:
         """Generate circle centers for Flower of Life pattern.
 
         Args:
             layers: Number of hexagonal layers around center
 
         Returns:
-            List of circle centers
+            Circle centers, the central circle first
         """
-        centers = [Point2D(0.0, 0.0)]  # Central circle
-
-        for layer in range(1, layers + 1):
-            # Each layer forms a hexagon
-            for i in range(6 * layer):
-                angle = (i / (6 * layer)) * 2 * math.pi
-                x = layer * self.radius * math.cos(angle)
-                y = layer * self.radius * math.sin(angle)
-
-                # Only add if not duplicate (accounting for floating point)
-                new_point = Point2D(x, y)
-                if not any(new_point.distance_to(p) < 0.1 * self.radius for p in centers):
-                    centers.append(new_point)
-
-        return centers
+        if layers < 1:
+            return Points2D(np.zeros((1, 2)))  # Central circle only
+
+        # Layer l contributes 6*l evenly spaced points on a ring of radius l*r.
+        ring = np.arange(1, layers + 1)
+        layer_of = np.repeat(ring, 6 * ring)
+        index_in_layer = np.arange(layer_of.size) - np.repeat(3 * ring * (ring - 1), 6 * ring)
+        angles = (index_in_layer / (6 * layer_of)) * 2 * np.pi
+        xs = np.concatenate(([0.0], layer_of * self.radius * np.cos(angles)))
+        ys = np.concatenate(([0.0], layer_of * self.radius * np.sin(angles)))
+
+        # Drop near-duplicates (accounting for floating point) by snapping to a
+        # 0.1 * radius grid, keeping the first occurrence in generation order.
+        cell = 0.1 * self.radius
+        keys = np.stack([np.round(xs / cell), np.round(ys / cell)], axis=1).astype(np.int64)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        first.sort()
+
+        return Points2D(np.column_stack([xs[first], ys[first]]))
 
     def generate_vesica_piscis(self) -> Tuple[Point2D, Point2D]:
         """Generate two circles forming Vesica Piscis.
@@ -68,6 +127,40 @@ class FlowerOfLifeGenerator:
         return (Point2D(-self.radius / 2, 0.0), Point2D(self.radius / 2, 0.0))
 
 
+# Unit hexagon directions for Metatron's Cube; the outer ring is offset by 30 degrees.
+_INNER_ANGLES = np.arange(6) * (math.pi / 3)
+_OUTER_ANGLES = _INNER_ANGLES + math.pi / 6
+_METATRON_INNER_RING = np.column_stack([np.cos(_INNER_ANGLES), np.sin(_INNER_ANGLES)])
+_METATRON_OUTER_RING = np.column_stack([np.cos(_OUTER_ANGLES), np.sin(_OUTER_ANGLES)])
+
+
+def _metatron_edges() -> List[Tuple[int, int]]:
+    edges = []
+
+    # Connect center to all vertices
+    for i in range(1, 13):
+        edges.append((0, i))
+
+    # Connect inner hexagon
+    for i in range(1, 7):
+        edges.append((i, (i % 6) + 1))
+
+    # Connect outer hexagon
+    for i in range(7, 13):
+        edges.append((i, ((i - 7 + 1) % 6) + 7))
+
+    # Connect inner to outer
+    for i in range(6):
+        edges.append((i + 1, i + 7))
+        edges.append((i + 1, ((i + 1) % 6) + 7))
+
+    return edges
+
+
+# The edges depend only on vertex order, never on the radius.
+_METATRON_EDGES: Tuple[Tuple[int, int], ...] = tuple(_metatron_edges())
+
+
 class MetatronsCubeGenerator:
     """Generate Metatron's Cube sacred geometry pattern."""
 
@@ -75,29 +168,21 @@ class MetatronsCubeGenerator:
         """Initialize with radius."""
         self.radius = radius
 
-    def generate_vertices(self) -> List[Point2D]:
+    def generate_vertices(self) -> Points2D:
         """Generate 13 vertices of Metatron's Cube.
 
         Returns:
-            List of 13 vertices (1 center + 2 hexagonal rings)
+            13 vertices (1 center + 2 hexagonal rings)
         """
-        vertices = [Point2D(0.0, 0.0)]  # Center
-
-        # First hexagonal ring
-        for i in range(6):
-            angle = i * (math.pi / 3)
-            x = self.radius * math.cos(angle)
-            y = self.radius * math.sin(angle)
-            vertices.append(Point2D(x, y))
-
-        # Second hexagonal ring (offset by 30 degrees)
-        for i in range(6):
-            angle = i * (math.pi / 3) + (math.pi / 6)
-            x = self.radius * PHI * math.cos(angle)
-            y = self.radius * PHI * math.sin(angle)
-            vertices.append(Point2D(x, y))
-
-        return vertices
+        return Points2D(
+            np.concatenate(
+                [
+                    np.zeros((1, 2)),  # Center
+                    self.radius * _METATRON_INNER_RING,
+                    self.radius * PHI * _METATRON_OUTER_RING,
+                ]
+            )
+        )
 
     def generate_edges(self) -> List[Tuple[int, int]]:
         """Generate all edges connecting vertices.
@@ -105,26 +190,15 @@ class MetatronsCubeGenerator:
         Returns:
             List of vertex index pairs
         """
-        edges = []
-
-        # Connect center to all vertices
-        for i in range(1, 13):
-            edges.append((0, i))
-
-        # Connect inner hexagon
-        for i in range(1, 7):
-            edges.append((i, (i % 6) + 1))
-
-        # Connect outer hexagon
-        for i in range(7, 13):
-            edges.append((i, ((i - 7 + 1) % 6) + 7))
+        return list(_METATRON_EDGES)
 
-        # Connect inner to outer
-        for i in range(6):
-            edges.append((i + 1, i + 7))
-            edges.append((i + 1, ((i + 1) % 6) + 7))
 
-        return edges
+# Rotation by 0, 90, 180 and 270 degrees, indexed by spiral direction.
+_QUARTER_TURNS = np.array(
+    [[[1, 0], [0, 1]], [[0, -1], [1, 0]], [[-1, 0], [0, -1]], [[0, 1], [-1, 0]]], dtype=float
+)
+# Origin shift (in units of the current square size) after an arc in each direction.
+_SPIRAL_STEPS = np.array([[1, 0], [0, 1], [-1, -1], [0, -1]], dtype=float)
 
 
 class GoldenSpiralGenerator:
@@ -134,7 +208,7 @@ class GoldenSpiralGenerator:
         """Initialize with initial square size."""
         self.initial_size = initial_size
 
-    def generate_arc_points(self, iterations: int = 8, points_per_arc: int = 20) -> List[Point2D]:
+    def generate_arc_points(self, iterations: int = 8, points_per_arc: int = 20) -> Points2D:
         """Generate points along golden spiral.
 
         Args:
@@ -142,110 +216,114 @@ class GoldenSpiralGenerator:
             points_per_arc: Number of points per quarter-circle arc
 
         Returns:
-            List of points along the spiral
+            Points along the spiral
         """
-        points = []
-        size = self.initial_size
-        x, y = 0.0, 0.0
-        direction = 0  # 0=right, 1=down, 2=left, 3=up
-
-        for iteration in range(iterations):
-            # Generate quarter-circle arc
-            for i in range(points_per_arc):
-                t = i / points_per_arc
-                angle = (math.pi / 2) * t
-
-                # Calculate point on arc based on direction
-                if direction == 0:  # Right
-                    px = x + size * (1 - math.cos(angle))
-                    py = y + size * math.sin(angle)
-                elif direction == 1:  # Down
-                    px = x - size * math.sin(angle)
-                    py = y + size * (1 - math.cos(angle))
-                elif direction == 2:  # Left
-                    px = x - size * (1 - math.cos(angle))
-                    py = y - size * math.sin(angle)
-                else:  # Up
-                    px = x + size * math.sin(angle)
-                    py = y - size * (1 - math.cos(angle))
-
-                points.append(Point2D(px, py))
-
-            # Update position and size for next iteration
-            if direction == 0:
-                x += size
-            elif direction == 1:
-                y += size
-            elif direction == 2:
-                x -= size
-                y -= size
-            else:
-                y -= size
-
-            direction = (direction + 1) % 4
-            size *= PHI
-
-        return points
+        # One quarter-circle arc heading right; the other directions are the
+        # same arc rotated by multiples of 90 degrees.
+        angles = (math.pi / 2) * (np.arange(points_per_arc) / points_per_arc)
+        arc = np.column_stack([1 - np.cos(angles), np.sin(angles)])
+
+        directions = np.arange(iterations) % 4  # 0=right, 1=down, 2=left, 3=up
+        sizes = self.initial_size * PHI ** np.arange(iterations)
+
+        # Each arc starts where the previous one's square moved the origin.
+        steps = _SPIRAL_STEPS[directions] * sizes[:, None]
+        origins = np.cumsum(steps, axis=0) - steps
+
+        arcs = np.einsum("pj,kij->kpi", arc, _QUARTER_TURNS[directions])
+        points = origins[:, None, :] + sizes[:, None, None] * arcs
+        return Points2D(points.reshape(-1, 2))
+
+
+def _frozen(vertices: list) -> np.ndarray:
+    array = np.array(vertices, dtype=float)
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=None)
+def _tetrahedron_vertices() -> np.ndarray:
+    return _frozen([[1, 1, 1], [-1, -1, 1], [-1, 1, -1], [1, -1, -1]])
+
+
+@lru_cache(maxsize=None)
+def _cube_vertices() -> np.ndarray:
+    # Bits 0, 1 and 2 of the vertex index select the sign of x, y and z.
+    bits = np.unpackbits(np.arange(8, dtype=np.uint8)[:, None], axis=1, bitorder="little")[:, :3]
+    return _frozen(bits * 2.0 - 1.0)
+
+
+@lru_cache(maxsize=None)
+def _octahedron_vertices() -> np.ndarray:
+    return _frozen([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]])
+
+
+@lru_cache(maxsize=None)
+def _icosahedron_vertices() -> np.ndarray:
+    vertices = []
+    for i in [-1, 1]:
+        for j in [-1, 1]:
+            vertices.append([0, i, j * PHI])
+            vertices.append([i, j * PHI, 0])
+            vertices.append([i * PHI, 0, j])
+    return _frozen(vertices)
+
+
+@lru_cache(maxsize=None)
+def _dodecahedron_vertices() -> np.ndarray:
+    vertices = []
+
+    # Cube vertices
+    for i in [-1, 1]:
+        for j in [-1, 1]:
+            for k in [-1, 1]:
+                vertices.append([i, j, k])
+
+    # Rectangular faces
+    phi_inv = 1 / PHI
+    for i in [-1, 1]:
+        for j in [-1, 1]:
+            vertices.append([0, i * phi_inv, j * PHI])
+            vertices.append([i * phi_inv, j * PHI, 0])
+            vertices.append([i * PHI, 0, j * phi_inv])
+
+    return _frozen(vertices)
 
 
 class PlatonicSolidProjector:
-    """Project 3D Platonic solids onto 2D plane."""
+    """Project 3D Platonic solids onto 2D plane.
+
+    The ``*_vertices`` methods return shared, read-only arrays; call
+    ``.copy()`` before modifying one.
+    """
 
     @staticmethod
     def tetrahedron_vertices() -> np.ndarray:
         """Get tetrahedron vertices."""
-        return np.array([[1, 1, 1], [-1, -1, 1], [-1, 1, -1], [1, -1, -1]], dtype=float)
+        return _tetrahedron_vertices()
 
     @staticmethod
     def cube_vertices() -> np.ndarray:
         """Get cube vertices."""
-        vertices = []
-        for i in range(8):
-            x = 1 if i & 1 else -1
-            y = 1 if i & 2 else -1
-            z = 1 if i & 4 else -1
-            vertices.append([x, y, z])
-        return np.array(vertices, dtype=float)
+        return _cube_vertices()
 
     @staticmethod
     def octahedron_vertices() -> np.ndarray:
         """Get octahedron vertices."""
-        return np.array([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]], dtype=float)
+        return _octahedron_vertices()
 
     @staticmethod
     def icosahedron_vertices() -> np.ndarray:
         """Get icosahedron vertices."""
-        vertices = []
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                vertices.append([0, i, j * PHI])
-                vertices.append([i, j * PHI, 0])
-                vertices.append([i * PHI, 0, j])
-        return np.array(vertices, dtype=float)
+        return _icosahedron_vertices()
 
     @staticmethod
     def dodecahedron_vertices() -> np.ndarray:
         """Get dodecahedron vertices."""
-        vertices = []
-
-        # Cube vertices
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                for k in [-1, 1]:
-                    vertices.append([i, j, k])
-
-        # Rectangular faces
-        phi_inv = 1 / PHI
-        for i in [-1, 1]:
-            for j in [-1, 1]:
-                vertices.append([0, i * phi_inv, j * PHI])
-                vertices.append([i * phi_inv, j * PHI, 0])
-                vertices.append([i * PHI, 0, j * phi_inv])
-
-        return np.array(vertices, dtype=float)
+        return _dodecahedron_vertices()
 
     @staticmethod
-    def project_2d(vertices_3d: np.ndarray, rotation: Tuple[float, float, float] = (0, 0, 0)) -> List[Point2D]:
+    def project_2d(vertices_3d: np.ndarray, rotation: Tuple[float, float, float] = (0, 0, 0)) -> Points2D:
         """Project 3D vertices to 2D using perspective projection.
 
         Args:
@@ -253,7 +331,7 @@ class PlatonicSolidProjector:
             rotation: (rx, ry, rz) rotation angles in radians
 
         Returns:
-            List of 2D projected points
+            2D projected points
         """
         # Apply rotations
         rx, ry, rz = rotation
@@ -265,20 +343,16 @@ class PlatonicSolidProjector:
 
         Rz = np.array([[math.cos(rz), -math.sin(rz), 0], [math.sin(rz), math.cos(rz), 0], [0, 0, 1]])
 
-        # Apply rotations
-        rotated = vertices_3d @ Rx.T @ Ry.T @ Rz.T
-
-        # Perspective projection (simple orthographic for now)
-        points_2d = []
-        for vertex in rotated:
-            # Simple orthographic projection (ignore z)
-            points_2d.append(Point2D(vertex[0], vertex[1]))
-
-        return points_2d
+        # Compose the rotations once and keep only the x/y rows: the
+        # orthographic projection discards z, so one (N, 3) @ (3, 2) matmul
+        # replaces the three chained rotations.
+        projection = (Rz @ Ry @ Rx)[:2]
+        return Points2D(vertices_3d @ projection.T)
 
 
 __all__ = [
     "Point2D",
+    "Points2D",
     "FlowerOfLifeGenerator",
     "MetatronsCubeGenerator",
     "GoldenSpiralGenerator",
@@ -0,0 +1,61 @@
+"""Unit tests for the sacred geometry pattern generators."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from lucidia.quantum_engine.sacred_patterns import (
+    FlowerOfLifeGenerator,
+    GoldenSpiralGenerator,
+    PlatonicSolidProjector,
+    Point2D,
+    Points2D,
+)
+
+
+def test_flower_of_life_circle_counts_and_rings() -> None:
+    generator = FlowerOfLifeGenerator(radius=2.0)
+    centers = generator.generate_circles(layers=3)
+    assert len(centers) == 1 + 6 + 12 + 18
+    assert centers[0].to_tuple() == (0.0, 0.0)
+    first_ring = centers[1:7]
+    assert all(math.isclose(math.hypot(p.x, p.y), 2.0) for p in first_ring)
+    assert math.isclose(centers[1].x, 2.0) and math.isclose(centers[1].y, 0.0, abs_tol=1e-12)
+
+
+def test_flower_of_life_without_layers_is_the_central_circle() -> None:
+    centers = FlowerOfLifeGenerator().generate_circles(layers=0)
+    assert [p.to_tuple() for p in centers] == [(0.0, 0.0)]
+
+
+def test_points2d_views_and_point_compatibility() -> None:
+    points = Points2D(np.array([[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]))
+    assert points.x.tolist() == [0.0, 2.0, 4.0]
+    assert np.shares_memory(points.y, points.xy)
+    assert points[1] == Point2D(2.0, 3.0)
+    assert isinstance(points[1:], Points2D) and len(points[1:]) == 2
+    assert points[np.int64(2)] == Point2D(4.0, 5.0)
+    assert points[[0, 2]] == Points2D(np.array([[0.0, 1.0], [4.0, 5.0]]))
+    assert points[points.x > 1.0] == points[1:]
+    assert points != points[:2]
+    assert np.allclose(points.distances_to(Point2D(0.0, 1.0)), [0.0, math.sqrt(8), math.sqrt(32)])
+    corner = Point2D(4.0, 5.0)
+    assert np.allclose(points.distances_to((4.0, 5.0)), [p.distance_to(corner) for p in points])
+    assert points.to_list() == [Point2D(0.0, 1.0), Point2D(2.0, 3.0), Point2D(4.0, 5.0)]
+
+
+def test_platonic_vertices_are_cached_and_read_only() -> None:
+    cube = PlatonicSolidProjector.cube_vertices()
+    assert cube is PlatonicSolidProjector.cube_vertices()
+    assert not cube.flags.writeable
+    assert cube.tolist()[:3] == [[-1.0, -1.0, -1.0], [1.0, -1.0, -1.0], [-1.0, 1.0, -1.0]]
+
+
+def test_golden_spiral_arcs_start_at_the_previous_square_corner() -> None:
+    generator = GoldenSpiralGenerator(initial_size=1.0)
+    points = generator.generate_arc_points(iterations=4, points_per_arc=4)
+    assert len(points) == 16
+    phi = (1 + math.sqrt(5)) / 2
+    assert np.allclose(points.xy[::4], [[0.0, 0.0], [1.0, 0.0], [1.0, phi], [-phi, -1.0]])
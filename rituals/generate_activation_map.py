@@ -2,22 +2,48 @@
 import os
 import subprocess
 import datetime
+import functools
 import pathlib
 import re
+import shlex
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-def sh(cmd, cwd=None):
-    result = subprocess.run(
-        cmd,
-        cwd=cwd,
-        shell=True,
-        text=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+import yaml
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# One pattern for every task bucket; the named group that matched says which.
+_TASK_RE = re.compile(
+    r"\b(?:"
+    r"(?P<now>NOW|DOING|PRIORITY|P1)"
+    r"|(?P<next>TODO|NEXT|P2)"
+    r"|(?P<blocked>BLOCKED|WAITING)"
+    r"|(?P<quick>quick|5min|tiny)"
+    r")\b",
+    re.IGNORECASE,
+)
+# ``git rev-list --left-right --count`` output: "<behind> <ahead>".
+_DIV_RE = re.compile(r"^\s*(\d+)\s+(\d+)\s*$")
+# The activation map lists at most this many tasks per bucket.
+_TASKS_PER_BUCKET = 10
+
+def sh(argv, cwd=None):
+    try:
+        result = subprocess.run(
+            argv,
+            cwd=cwd,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError as exc:
+        print(f"Error running command: {shlex.join(argv)}\n{exc}", file=sys.stderr)
+        return ""
     if result.returncode != 0:
         error_output = result.stderr.strip()
-        message = f"Error running command: {cmd}"
+        message = f"Error running command: {shlex.join(argv)}"
         if error_output:
             message = f"{message}\n{error_output}"
         print(message, file=sys.stderr)
@@ -25,21 +51,39 @@ def sh(cmd, cwd=None):
     return result.stdout.strip()
 
 
-def harvest_repo(repo_path, default_branch, recent_hours, stale_days):
-    now = datetime.datetime.utcnow()
+def _utcnow():
+    # Naive UTC, formatted with a trailing "Z" below.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def harvest_repo(repo_path, default_branch, recent_hours, stale_days, now=None):
+    if now is None:
+        now = _utcnow()
     recent_cut = (now - datetime.timedelta(hours=recent_hours)).isoformat(timespec="seconds") + "Z"
     stale_cut_date = (now - datetime.timedelta(days=stale_days)).date()
 
-    current = sh("git rev-parse --abbrev-ref HEAD", cwd=repo_path)
-    ahead = sh(f"git rev-list --left-right --count {default_branch}...HEAD", cwd=repo_path)
-    commits = sh(
-        f"git log --since='{recent_cut}' --pretty='format:%h %ad %s' --date=relative",
-        cwd=repo_path,
-    )
-    branches = sh(
-        "git for-each-ref --format='%(refname:short)|%(committerdate:short)' refs/heads",
-        cwd=repo_path,
-    )
+    # The git reads are independent, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        current, ahead, commits, branches = pool.map(
+            lambda argv: sh(argv, cwd=repo_path),
+            [
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                ["git", "rev-list", "--left-right", "--count", f"{default_branch}...HEAD"],
+                [
+                    "git",
+                    "log",
+                    f"--since={recent_cut}",
+                    "--pretty=format:%h %ad %s",
+                    "--date=relative",
+                ],
+                [
+                    "git",
+                    "for-each-ref",
+                    "--format=%(refname:short)|%(committerdate:short)",
+                    "refs/heads",
+                ],
+            ],
+        )
 
     stale = []
     for line in filter(None, branches.splitlines()):
@@ -72,22 +116,26 @@ def harvest_repo(repo_path, default_branch, recent_hours, stale_days):
     }
 
 
-def read_tasks(files):
-    lines = []
-    for path in files:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8", errors="ignore") as handle:
-                lines.extend(line.rstrip() for line in handle if line.strip())
+def read_tasks(files, limit=_TASKS_PER_BUCKET):
     # naive parse: TODO, DOING, BLOCKED
-    def pick(tag):
-        return [line for line in lines if re.search(fr"\b{tag}\b", line, re.IGNORECASE)]
-
-    return {
-        "now": pick("NOW|DOING|PRIORITY|P1"),
-        "next": pick("TODO|NEXT|P2"),
-        "blocked": pick("BLOCKED|WAITING"),
-        "quick": [line for line in lines if re.search(r"\b(quick|5min|tiny)\b", line, re.IGNORECASE)],
-    }
+    buckets = {"now": [], "next": [], "blocked": [], "quick": []}
+    open_buckets = len(buckets)
+    for path in files:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", errors="ignore") as handle:
+            for line in handle:
+                # A line can carry several tags, so collect every bucket it hits.
+                for bucket in {match.lastgroup for match in _TASK_RE.finditer(line)}:
+                    items = buckets[bucket]
+                    if len(items) < limit:
+                        items.append(line.rstrip())
+                        if len(items) == limit:
+                            open_buckets -= 1
+                if not open_buckets:
+                    # Only the first ``limit`` entries per bucket are shown.
+                    return buckets
+    return buckets
 
 
 def last_reflection(path):
@@ -98,29 +146,45 @@ def last_reflection(path):
     return lines[-1] if lines else None
 
 
-def load_yaml(path):
-    import yaml
-
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path, mtime_ns):
     with open(path, "r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+        return yaml.load(handle, Loader=_YAML_LOADER)
+
+
+def load_yaml(path):
+    # Keyed on mtime so an edited config is re-read; callers must not mutate it.
+    return _load_yaml_cached(path, os.stat(path).st_mtime_ns)
 
 
 def main(cfg_path):
     cfg = load_yaml(cfg_path)
+    # One timestamp for the whole map, so the header and the per-repo
+    # cut-offs agree.
+    now = _utcnow()
     sections = []
 
     # repos
-    repo_blocks = []
-    for repo in cfg.get("repos", []):
-        info = harvest_repo(
-            repo["path"],
-            repo.get("default_branch", "main"),
-            cfg.get("recent_commit_hours", 24),
-            cfg.get("stale_branch_days", 7),
+    repos = cfg.get("repos", [])
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(repos)))) as pool:
+        infos = list(
+            pool.map(
+                lambda repo: harvest_repo(
+                    repo["path"],
+                    repo.get("default_branch", "main"),
+                    cfg.get("recent_commit_hours", 24),
+                    cfg.get("stale_branch_days", 7),
+                    now=now,
+                ),
+                repos,
+            )
         )
-        divergence_parts = info.get("divergence", "").split()
-        if len(divergence_parts) == 2 and all(part.isdigit() for part in divergence_parts):
-            behind, ahead = divergence_parts
+
+    repo_blocks = []
+    for repo, info in zip(repos, infos):
+        divergence = _DIV_RE.match(info.get("divergence", ""))
+        if divergence:
+            behind, ahead = divergence.groups()
         else:
             print(
                 f"Warning: Unexpected divergence format for repo '{repo['path']}': '{info.get('divergence', '')}'",
@@ -152,7 +216,7 @@ def main(cfg_path):
     tasks = read_tasks(cfg.get("tasks_files", []))
 
     def bullet(title, items):
-        body = "\n  - " + ("\n  - ".join(items[:10]) if items else "none")
+        body = "\n  - " + ("\n  - ".join(items[:_TASKS_PER_BUCKET]) if items else "none")
         return f"**{title}**{body}"
 
     sections.append(
@@ -173,7 +237,7 @@ def main(cfg_path):
 
     out = (
         "# Lucidia — Next‑Day Activation Map\n"
-        f"Generated: {datetime.datetime.utcnow().isoformat(timespec='seconds')}Z\n\n"
+        f"Generated: {now.isoformat(timespec='seconds')}Z\n\n"
         + "\n\n".join(sections)
         + "\n"
     )
@@ -0,0 +1,122 @@
+"""Route tests for the Flask SymPy service."""
+
+from __future__ import annotations
+
+import pytest
+
+from lucidia.app import _cached_diff, _cached_simplify, app
+
+
+@pytest.fixture()
+def client():
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_index_and_health(client) -> None:
+    assert client.get("/").status_code == 200
+    assert client.get("/health").get_json() == {"status": "healthy"}
+
+
+def test_math_evaluates_numbers(client) -> None:
+    response = client.post("/math", json={"expression": "2 + 3"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert float(body["result"]) == 5.0
+    assert body["simplified"] == "5"
+
+
+def test_math_rejects_missing_and_invalid_expressions(client) -> None:
+    assert client.post("/math", json={}).status_code == 400
+    response = client.post("/math", json={"expression": "(x +"})
+    assert response.status_code == 400
+    assert response.get_json()["error"]
+
+
+def test_derivative(client) -> None:
+    response = client.post("/derivative", json={"expression": "x**3 + y", "variable": "y"})
+    assert response.get_json()["derivative"] == "1"
+    response = client.post("/derivative", json={"expression": "x**3"})
+    assert response.get_json()["derivative"] == "3*x**2"
+
+
+def test_repeated_derivative_is_served_from_cache(client) -> None:
+    payload = {"expression": "x**4 + sin(x)"}
+    client.post("/derivative", json=payload)
+    hits = _cached_diff.cache_info().hits
+    response = client.post("/derivative", json=payload)
+    assert _cached_diff.cache_info().hits == hits + 1
+    assert response.get_json()["derivative"] == "4*x**3 + cos(x)"
+
+
+def test_math_expands_polynomials(client) -> None:
+    body = client.post("/math", json={"expression": "(x + 1)**2"}).get_json()
+    assert body["simplified"] == "x**2 + 2*x + 1"
+
+
+def test_large_polynomial_powers_are_not_expanded(client) -> None:
+    response = client.post("/simplify", json={"expression": "(x + 1)**2000"})
+    assert response.get_json()["simplified"] == "(x + 1)**2000"
+
+
+def test_oversized_results_are_not_cached(client) -> None:
+    expr = " + ".join(f"x**{i}" for i in range(1, 3000))
+    client.post("/simplify", json={"expression": expr})
+    info = _cached_simplify.cache_info()
+    client.post("/simplify", json={"expression": expr})
+    after = _cached_simplify.cache_info()
+    assert (after.hits, after.currsize) == (info.hits, info.currsize)
+
+
+def test_simplify_is_cheap_by_default_and_full_on_request(client) -> None:
+    expr = {"expression": "sin(x)**2 + cos(x)**2"}
+    assert client.post("/simplify", json=expr).get_json()["simplified"] != "1"
+    assert client.post("/simplify", json={**expr, "full": True}).get_json()["simplified"] == "1"
+    assert client.post("/simplify?full=1", json=expr).get_json()["simplified"] == "1"
+
+
+def test_responses_are_serialised_with_orjson_when_available(client) -> None:
+    pytest.importorskip("orjson")
+    from lucidia.app import ORJSONProvider
+
+    assert isinstance(app.json, ORJSONProvider)
+    response = client.post("/derivative", json={"expression": "x**2"})
+    assert response.mimetype == "application/json"
+    expected = '{"derivative":"2*x","expression":"x**2","variable":"x"}'
+    assert response.get_data(as_text=True) == expected
+
+
+def test_surrounding_whitespace_shares_the_cached_result(client) -> None:
+    client.post("/derivative", json={"expression": "x**5 - x"})
+    hits = _cached_diff.cache_info().hits
+    response = client.post("/derivative", json={"expression": "  x**5 - x \n"})
+    assert _cached_diff.cache_info().hits == hits + 1
+    assert response.get_json()["derivative"] == "5*x**4 - 1"
+
+
+def test_index_lists_eval_batch(client) -> None:
+    assert "/math/eval_batch" in client.get("/").get_json()["endpoints"]
+
+
+def test_eval_batch_evaluates_every_point(client) -> None:
+    payload = {"expression": "x**2 + 1", "points": [0, 1.5, -2]}
+    response = client.post("/math/eval_batch", json=payload)
+    assert response.status_code == 200
+    assert response.get_json()["values"] == [1.0, 3.25, 5.0]
+
+    response = client.post(
+        "/math/eval_batch", json={"expression": "2", "variable": "t", "points": [1, 2, 3]}
+    )
+    values = response.get_json()["values"]
+    assert values == [2.0, 2.0, 2.0]
+    assert all(isinstance(value, float) for value in values)
+
+
+def test_eval_batch_rejects_bad_input(client) -> None:
+    assert client.post("/math/eval_batch", json={"expression": "x"}).status_code == 400
+    nested = {"expression": "x", "points": [[1, 2], [3, 4]]}
+    assert client.post("/math/eval_batch", json=nested).status_code == 400
+    response = client.post("/math/eval_batch", json={"expression": "x + y", "points": [1]})
+    assert response.status_code == 400
+    assert "y" in response.get_json()["error"]